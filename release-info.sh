@@ -1,6 +1,6 @@
 #!/bin/bash
 
 TAG=$(git describe "${GITHUB_REF}")
-git tag --list --format="%(subject)%0a%(body)" $TAG | sed '/^-----BEGIN PGP SIGNATURE-----$/,$d' > release.md
+git for-each-ref --format="%(contents:subject)%0a%(contents:body)" "refs/tags/${TAG}" > release.md
 echo "release_version=${TAG//v}" >> $GITHUB_ENV
-echo "component=$(basename `git rev-parse --show-toplevel`)" >> $GITHUB_ENV
\ No newline at end of file
+echo "component=${GITHUB_REPOSITORY#*/}" >> $GITHUB_ENV
\ No newline at end of file